@@ -3,6 +3,16 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+
+def _env(name: str, default: str, cast=str):
+    """
+    Read a setting from the environment, treating empty strings as unset
+    (GitHub Actions passes secrets that aren't configured as empty strings)
+    """
+    value = os.environ.get(name, "").strip()
+    return cast(value or default)
+
+
 # Discord webhook URL
 DISCORD_WEBHOOK_URL = os.getenv(
     "DISCORD_WEBHOOK_URL",
@@ -14,29 +24,29 @@ DISCORD_WEBHOOK_URL = os.getenv(
 DISCORD_USER_ID = os.getenv("DISCORD_USER_ID", "318472879799009281")
 
 # Price range (monthly lease rate in euros)
-# Handle empty strings from environment variables
-_min_price = os.getenv("MIN_PRICE", "50")
-_min_price = _min_price if _min_price and _min_price.strip() else "50"
-MIN_PRICE = float(_min_price)
+MIN_PRICE = _env("MIN_PRICE", "50", float)
+MAX_PRICE = _env("MAX_PRICE", "200", float)
 
-_max_price = os.getenv("MAX_PRICE", "200")
-_max_price = _max_price if _max_price and _max_price.strip() else "200"
-MAX_PRICE = float(_max_price)
+# Set if the store lists offers sorted by ascending price - offer details are
+# then only extracted until the prices on a page exceed MAX_PRICE
+PRICES_SORTED = _env("PRICES_SORTED", "false").lower() in ("1", "true", "yes")
 
 # Yearly kilometer allowance (km per year)
-_km_allowance = os.getenv("KM_ALLOWANCE", "15000")
-_km_allowance = _km_allowance if _km_allowance and _km_allowance.strip() else "15000"
-KM_ALLOWANCE = int(_km_allowance)
+KM_ALLOWANCE = _env("KM_ALLOWANCE", "15000", int)
 
 # Check interval in seconds (30 minutes = 1800 seconds)
-_check_interval = os.getenv("CHECK_INTERVAL", "1800")
-_check_interval = _check_interval if _check_interval and _check_interval.strip() else "1800"
-CHECK_INTERVAL = int(_check_interval)
+CHECK_INTERVAL = _env("CHECK_INTERVAL", "1800", int)
 
 # Peugeot store URL with filters: 24 months / 15,000 km and 24 months / 20,000 km, max price 151€, radius 50km
 STORE_URL = "https://financing.peugeot.store/bestand"
 
-# Storage file for tracking seen offers
-OFFERS_FILE = "offers.json"
+# Storage file for tracking seen offers (SQLite database)
+OFFERS_FILE = "offers.sqlite"
+
+# Seen offers file of older versions - only checked to upgrade without re-notifying
+LEGACY_OFFERS_FILE = "offers.json"
+
+# Cache of page ETags/Last-Modified headers and their extracted offers
+PAGE_CACHE_FILE = "page_cache.json"
 
 
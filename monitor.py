@@ -1,14 +1,29 @@
 import requests
-import json
+import orjson
 import time
+import functools
 import logging
+import hashlib
+import os
 import re
+import sqlite3
 import sys
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import config
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    # selectolax is optional - fall back to BeautifulSoup with lxml
+    LexborHTMLParser = None
+    from bs4 import BeautifulSoup, SoupStrainer
+
 # Configure logging with UTF-8 encoding
 logging.basicConfig(
     level=logging.INFO,
@@ -29,6 +44,104 @@ if sys.platform == 'win32':
         pass
 
 
+# Precompiled patterns (compiled once at import instead of on every call)
+_PRICE_LINE_RE = re.compile(r'\d+[.,]\d+\s*€\s*/?\s*Monat', re.I)
+_RAW_MONAT_RE = re.compile(rb'Monat', re.I)
+_PRICE_CAPTURE_RE = re.compile(r'(\d+[.,]\d+)\s*€\s*/?\s*Monat', re.I)
+_PRICE_PREFIX_RE = re.compile(r'^\d+[.,]\d+\s*€')
+_MODEL_RE = re.compile(r'(\d{3,4}\s*(?:SW|GT|ALLURE|STYLE|ACTIVE)?\s*[A-Z\s]+)')
+_DEALER_RE = re.compile(r'((?:Autohaus|Peugeot|Stellantis)[^\n]*?)(?:\n|$)', re.I)
+_DEALER_NAME_RE = re.compile(r'Autohaus|Peugeot|Stellantis', re.I)
+_TERMS_RE = re.compile(r'(\d+\s*Mon\.?\s*/\s*(\d+[.,]?\d*)\s*k?m)', re.I)
+_TERMS_LINE_RE = re.compile(r'\d+\s*Mon\.?\s*/\s*\d+', re.I)
+_KM_RE = re.compile(r'/\s*(\d+[.,]?\d*)\s*k?m', re.I)
+_OFFER_CLASS_RE = re.compile(r'offer|vehicle|card|item|product', re.I)
+# Next links are detected on the raw bytes instead of walking the parsed tree:
+# each link's opening tag and content (inner tags are stripped before matching).
+# Scripts, styles, templates and comments are removed first so markup inside them
+# can't pass for a link
+_NON_MARKUP_RE = re.compile(
+    rb'<script\b.*?</script\s*>|<style\b.*?</style\s*>|<template\b.*?</template\s*>|<!--.*?-->',
+    re.I | re.S,
+)
+_LINK_RE = re.compile(rb'<a\b([^>]*)>(.*?)</a>', re.I | re.S)
+_TAG_RE = re.compile(rb'<[^>]*>')
+# Page info is matched on the parsed text (attributes excluded, entities decoded)
+_PAGE_OF_RE = re.compile(r'(\d+)\s*von\s*(\d+)', re.I)
+_NEXT_RE = re.compile(rb'\xc2\xbb|&raquo;|&#187;|&gt;|>|next|weiter', re.I)
+_NEXT_LABEL_RE = re.compile(rb'next|weiter', re.I)
+_ARIA_LABEL_RE = re.compile(rb'\baria-label\s*=\s*["\']([^"\']*)', re.I)
+_CLASS_ATTR_RE = re.compile(rb'\bclass\s*=\s*["\']([^"\']*)', re.I)
+_ARIA_DISABLED_RE = re.compile(rb'\baria-disabled\b', re.I)
+
+# Characters kept when parsing a price
+_PRICE_CHARS = frozenset('0123456789.,')
+
+# Container elements that can hold a single offer
+_CONTAINER_TAGS = ['article', 'div', 'section', 'li']
+
+# BeautifulSoup fallback skips the <head> contents and scripts/styles directly in
+# <body>. The strainer only decides for elements not inside an already kept one:
+# html/body are rejected so their children get decided individually, and every
+# other element is kept with its full subtree
+_OFFER_STRAINER = None if LexborHTMLParser is not None else SoupStrainer(
+    re.compile(r'^(?!(?:html|head|body|title|meta|link|script|style|noscript|template)$)')
+)
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Shared HTTP session for the monitor's lifetime: reuses pooled connections
+# across pages and checks, and retries transient errors with backoff
+# (POSTs are not retried by urllib3, Discord 429s are handled in _post_webhook)
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,  # at least PREFETCH_PAGES
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# Number of result pages fetched concurrently ahead of the page being processed
+PREFETCH_PAGES = 4
+
+# Be respectful with requests - global limit shared by all fetch threads
+REQUESTS_PER_SECOND = 2
+_rate_limit_lock = threading.Lock()
+_next_request_at = 0.0
+
+# Discord allows up to 10 embeds per webhook message
+DISCORD_MAX_EMBEDS = 10
+
+# ETag/Last-Modified and extracted results per page URL from previous checks
+# Bump the version when the cached offer format changes
+PAGE_CACHE_VERSION = 3
+_page_cache = {}
+
+
+def _price_cutoff() -> Optional[float]:
+    """
+    Price above which offer extraction stops early, or None when PRICES_SORTED is off
+    """
+    return config.MAX_PRICE if config.PRICES_SORTED else None
+
+
+def _cached_page(url: str) -> Optional[Dict]:
+    """
+    Get the cache entry for a page, unless its offers were cut at a different price
+    """
+    cached = _page_cache.get(url)
+    if cached and cached.get('price_cutoff') == _price_cutoff():
+        return cached
+    return None
+
+
+# The same price and terms strings repeat across offers and checks, so their
+# parsed values are memoized (keyed on the short matched text, not the card)
+@functools.lru_cache(maxsize=4096)
 def parse_german_price(price_str: str) -> Optional[float]:
     """
     Parse German price format (e.g., "139,09 €" -> 139.09 or "126.32  / Monat" -> 126.32)
@@ -37,36 +150,29 @@ def parse_german_price(price_str: str) -> Optional[float]:
     if not price_str:
         return None
     
-    # Extract just the number part - everything before "/" or "Monat"
-    # Handle Unicode spaces (\u2009, \u00A0, etc.) and regular spaces
-    price_str = re.sub(r'[/\u2009\u00A0\s]+.*$', '', price_str, flags=re.UNICODE)
+    # Extract just the number part - everything before "/" or the first space
+    # str.split() also splits on Unicode spaces (\u2009, \u00A0, etc.)
+    parts = price_str.split('/', 1)[0].split(None, 1)
+    price_str = parts[0] if parts else ''
     
-    # Remove currency symbols
-    price_str = price_str.replace('€', '').replace('EUR', '').strip()
+    # Keep only digits and separators (drops currency symbols and zero-width characters)
+    price_str = ''.join(ch for ch in price_str if ch in _PRICE_CHARS)
     
-    # Remove all Unicode whitespace characters
-    price_str = re.sub(r'[\u2000-\u200F\u2028-\u202F\u205F-\u206F]', '', price_str)
-    
-    # German format: dot is thousands separator, comma is decimal separator
-    # If there's a comma, it's the decimal separator
-    if ',' in price_str:
-        # Remove dots (thousands separators) and replace comma with dot
+    last_comma = price_str.rfind(',')
+    last_dot = price_str.rfind('.')
+    if last_comma > last_dot:
+        # German format: dot is thousands separator, comma is decimal separator
         price_str = price_str.replace('.', '').replace(',', '.')
-    else:
+    elif last_comma != -1:
+        # English format with comma thousands separator (e.g., "1,234.56")
+        price_str = price_str.replace(',', '')
+    elif last_dot != -1:
         # No comma, might be integer or already in English format
         # Check if dot is decimal separator (2 digits after) or thousands separator
-        if '.' in price_str:
-            parts = price_str.split('.')
-            if len(parts) == 2 and len(parts[1]) <= 2:
-                # Likely decimal separator (e.g., "126.32")
-                pass  # Keep as is
-            else:
-                # Likely thousands separator, remove dots
-                price_str = price_str.replace('.', '')
-    
-    # Extract just digits and one decimal point
-    # Remove any remaining non-numeric characters except one dot/comma
-    price_str = re.sub(r'[^\d.,]', '', price_str)
+        parts = price_str.split('.')
+        if len(parts) != 2 or len(parts[1]) > 2:
+            # Likely thousands separator, remove dots
+            price_str = price_str.replace('.', '')
     
     try:
         return float(price_str)
@@ -80,142 +186,334 @@ def parse_german_price(price_str: str) -> Optional[float]:
         return None
 
 
-def get_offers_from_page(soup: BeautifulSoup, base_url: str) -> List[Dict]:
+@functools.lru_cache(maxsize=4096)
+def parse_terms(terms_text: str) -> Tuple[str, Optional[int]]:
     """
-    Extract all leasing offers from a single page
+    Parse lease terms (e.g., "36 Mon. / 5.000 km" -> ("36 Mon. / 5.000 km", 5000))
     """
-    offers = []
+    terms = terms_text.strip()
+    km_per_year = None
+    # Extract km value and convert to integer (handle formats like "5.000" or "5000")
+    km_match = _KM_RE.search(terms)
+    if km_match:
+        km_str = km_match.group(1).replace('.', '').replace(',', '')
+        try:
+            km_per_year = int(km_str)
+        except ValueError:
+            km_per_year = None
+    return terms, km_per_year
+
+
+def parse_html(content: bytes):
+    """
+    Parse page content with selectolax (lexbor) or, if unavailable, BeautifulSoup
+    Returns the root element; the helpers below work with either backend
+    The BeautifulSoup fallback skips the <head> contents and top-level scripts
+    """
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(content).root
+    return BeautifulSoup(content, 'lxml', parse_only=_OFFER_STRAINER)
+
+
+def _node_text(node, separator: str = '', strip: bool = False) -> str:
+    """
+    Get the text of an element or text node
+    """
+    if LexborHTMLParser is not None:
+        return node.text(separator=separator, strip=strip)
+    return node.get_text(separator=separator, strip=strip)
+
+
+def _find_strings(node, pattern) -> List:
+    """
+    Find all text nodes below node matching pattern
+    """
+    if LexborHTMLParser is not None:
+        return [n for n in node.traverse(include_text=True) if n.tag == '-text' and pattern.search(n.text())]
+    return node.find_all(string=pattern)
+
+
+def _find_string(node, pattern):
+    """
+    Find the first text node below node matching pattern
+    """
+    if LexborHTMLParser is not None:
+        for n in node.traverse(include_text=True):
+            if n.tag == '-text' and pattern.search(n.text()):
+                return n
+        return None
+    return node.find(string=pattern)
+
+
+def _find_parent(node, tags: List[str]):
+    """
+    Find the closest ancestor of node with one of the given tag names
+    """
+    if LexborHTMLParser is not None:
+        parent = node.parent
+        while parent is not None and parent.tag not in tags:
+            parent = parent.parent
+        return parent
+    return node.find_parent(tags)
+
+
+def _node_key(node) -> int:
+    """
+    Stable identity of an element (selectolax creates new wrappers on every access)
+    """
+    if LexborHTMLParser is not None:
+        return node.mem_id
+    return id(node)
+
+
+def _select(node, selector: str) -> List:
+    """
+    Find all elements below node matching a CSS selector
+    """
+    if LexborHTMLParser is not None:
+        return node.css(selector)
+    return node.select(selector)
+
+
+def _select_one(node, selector: str):
+    """
+    Find the first element below node matching a CSS selector
+    """
+    if LexborHTMLParser is not None:
+        return node.css_first(selector)
+    return node.select_one(selector)
+
+
+def _get_attrs(node) -> Dict:
+    """
+    Get the attributes of an element as a dict
+    """
+    if LexborHTMLParser is not None:
+        return node.attributes
+    return node.attrs
+
+
+def _get_classes(node) -> List[str]:
+    """
+    Get the class names of an element as a list
+    """
+    classes = _get_attrs(node).get('class') or []
+    if isinstance(classes, str):
+        classes = classes.split()
+    return classes
+
+
+def is_last_page(tree, content: bytes, page_offers: List[Dict]) -> bool:
+    """
+    Check pagination indicators to decide whether this is the last page
+    Links are scanned in the raw HTML, page info in the parsed tree's text
+    """
+    # Look for pagination indicators
+    next_link = None
+    label_link = None
+    for match in _LINK_RE.finditer(_NON_MARKUP_RE.sub(b'', content)):
+        attrs = match.group(1)
+        if _NEXT_RE.search(_TAG_RE.sub(b'', match.group(2))):
+            next_link = attrs
+            break
+        if label_link is None:
+            # Try finding by aria-label
+            label = _ARIA_LABEL_RE.search(attrs)
+            if label and _NEXT_LABEL_RE.search(label.group(1)):
+                label_link = attrs
+    if next_link is None:
+        next_link = label_link
     
-    # Strategy 1: Find all price headings/divs with pattern "€ / Monat"
-    price_elements = soup.find_all(string=re.compile(r'\d+[.,]\d+\s*€\s*/?\s*Monat', re.I))
+    if next_link is not None:
+        # Check if it's disabled
+        classes = _CLASS_ATTR_RE.search(next_link)
+        return (bool(_ARIA_DISABLED_RE.search(next_link))
+                or (classes is not None and b'disabled' in classes.group(1).split()))
+    
+    # Check if we're on the last page by looking for page numbers
+    # If current page number equals max page number, stop
+    page_info = _PAGE_OF_RE.search(_node_text(tree, separator='\n'))
+    if page_info and int(page_info.group(1)) >= int(page_info.group(2)):
+        return True
+    
+    # If no next link and we got fewer offers than expected, might be last page
+    if len(page_offers) < 10:  # Assuming at least 10 offers per page normally
+        logger.info("Few offers found, might be last page")
+        return True
+    return False
+
+
+def _find_offer_containers(tree):
+    """
+    Yield (container, container_text) for each offer container found via its price
+    """
+    # Find all price headings/divs with pattern "€ / Monat"
+    price_elements = _find_strings(tree, _PRICE_LINE_RE)
     
     # Group price elements by their parent containers to avoid duplicates
     seen_containers = set()
     
     for price_elem in price_elements:
         # Find the parent container (article, div, section, etc.)
-        parent = price_elem.find_parent(['article', 'div', 'section', 'li'])
+        parent = _find_parent(price_elem, _CONTAINER_TAGS)
         
         # Keep going up until we find a substantial container
         while parent:
+            parent_id = _node_key(parent)
+            if parent_id in seen_containers:
+                # Container already extracted for an earlier price element -
+                # stop here instead of serializing it (and its ancestors) again
+                break
             # Check if this looks like an offer container
-            parent_text = parent.get_text()
+            parent_text = _node_text(parent, separator='\n')
             if len(parent_text) > 100:  # Substantial content
-                parent_id = id(parent)
-                if parent_id not in seen_containers:
-                    seen_containers.add(parent_id)
-                    try:
-                        offer = extract_offer_details(parent, base_url)
-                        if offer and offer['monthly_price']:
-                            offers.append(offer)
-                    except Exception as e:
-                        logger.debug(f"Error extracting offer: {e}")
+                seen_containers.add(parent_id)
+                yield parent, parent_text
+                break
+            parent = _find_parent(parent, _CONTAINER_TAGS)
+
+
+def _extract_offers(cards, base_url: str) -> List[Dict]:
+    """
+    Extract offers from (card, card_text) pairs
+    With PRICES_SORTED set, extraction stops once two offers in a row are above
+    MAX_PRICE, since every card after them is above it too
+    """
+    offers = []
+    stop_above = _price_cutoff()
+    previous_above = False
+    for card, card_text in cards:
+        try:
+            # Price first - it's all that's needed to decide whether to go on
+            price = extract_offer_price(card, card_text)
+            if price is None:
+                continue
+            above = stop_above is not None and price[1] > stop_above
+            if above and previous_above:
+                logger.info("Remaining offers on page are above max price, skipping them")
                 break
-            parent = parent.find_parent(['article', 'div', 'section', 'li'])
+            previous_above = above
+            
+            offer = extract_offer_details(card, card_text, base_url, price)
+            if offer and offer['monthly_price']:
+                offers.append(offer)
+        except Exception as e:
+            logger.debug("Error extracting offer: %s", e)
+    return offers
+
+
+def get_offers_from_page(tree, base_url: str) -> List[Dict]:
+    """
+    Extract all leasing offers from a single page
+    """
+    # Strategy 1: Find offer containers by their "€ / Monat" prices
+    offers = _extract_offers(_find_offer_containers(tree), base_url)
     
     # Strategy 2: If no offers found, try finding by class names
     if not offers:
-        offer_cards = soup.find_all(['article', 'div'], class_=re.compile(r'offer|vehicle|card|item|product', re.I))
-        for card in offer_cards:
-            try:
-                offer = extract_offer_details(card, base_url)
-                if offer and offer['monthly_price']:
-                    offers.append(offer)
-            except Exception as e:
-                logger.debug(f"Error extracting offer from card: {e}")
-                continue
+        offer_cards = [
+            card for card in _select(tree, 'article[class], div[class]')
+            if any(_OFFER_CLASS_RE.search(cls) for cls in _get_classes(card))
+        ]
+        offers = _extract_offers(((card, _node_text(card, separator='\n')) for card in offer_cards), base_url)
     
-    logger.info(f"Found {len(offers)} offers on page")
+    logger.info("Found %d offers on page", len(offers))
     return offers
 
 
-def extract_offer_details(card, base_url: str) -> Optional[Dict]:
+def extract_offer_price(card, card_text: str) -> Optional[Tuple[str, float]]:
+    """
+    Extract the monthly price of a card as (price_text, monthly_price)
+    """
+    # Cheap substring check before running any regex - cards without a
+    # monthly rate can't be offers (patterns are case-insensitive)
+    if 'monat' not in card_text.lower():
+        return None
+    
+    # Find price - look for pattern like "139,09 € / Monat"
+    price_text = None
+    price_match = _PRICE_CAPTURE_RE.search(card_text)
+    if price_match:
+        price_text = price_match.group(0)
+    else:
+        # Try finding in specific elements
+        price_elem = _find_string(card, _PRICE_LINE_RE)
+        if price_elem:
+            price_text = _node_text(price_elem).strip()
+    
+    if not price_text:
+        return None
+    
+    monthly_price = parse_german_price(price_text)
+    if monthly_price is None:
+        return None
+    return price_text, monthly_price
+
+
+def extract_offer_details(card, card_text: str, base_url: str,
+                          price: Optional[Tuple[str, float]] = None) -> Optional[Dict]:
     """
     Extract offer details from a card element
+    card_text is the card's text (newline separated), computed once by the caller;
+    price is the result of extract_offer_price() if the caller already has it
     """
     try:
-        card_text = card.get_text()
-        
-        # Find price - look for pattern like "139,09 € / Monat"
-        price_text = None
-        price_match = re.search(r'(\d+[.,]\d+)\s*€\s*/?\s*Monat', card_text, re.I)
-        if price_match:
-            price_text = price_match.group(0)
-        else:
-            # Try finding in specific elements
-            price_elem = card.find(string=re.compile(r'\d+[.,]\d+\s*€\s*/?\s*Monat', re.I))
-            if price_elem:
-                price_text = price_elem.strip()
-        
-        if not price_text:
-            return None
-        
-        monthly_price = parse_german_price(price_text)
-        if monthly_price is None:
-            return None
+        if price is None:
+            price = extract_offer_price(card, card_text)
+            if price is None:
+                return None
+        price_text, monthly_price = price
         
         # Find model name - look for patterns like "308 SW ALLURE" or similar
         model = None
         # Try headings first
         for tag in ['h1', 'h2', 'h3', 'h4', 'h5']:
-            model_elem = card.find(tag)
+            model_elem = _select_one(card, tag)
             if model_elem:
-                text = model_elem.get_text(strip=True)
+                text = _node_text(model_elem, strip=True)
                 # Check if it looks like a model name (contains numbers and letters, not just price)
-                if text and len(text) > 5 and not re.match(r'^\d+[.,]\d+\s*€', text):
+                if text and len(text) > 5 and not _PRICE_PREFIX_RE.match(text):
                     model = text
                     break
         
         # If no model found, try to extract from text patterns
         if not model:
             # Look for patterns like "308 SW", "2008", etc.
-            model_match = re.search(r'(\d{3,4}\s*(?:SW|GT|ALLURE|STYLE|ACTIVE)?\s*[A-Z\s]+)', card_text)
+            model_match = _MODEL_RE.search(card_text)
             if model_match:
                 model = model_match.group(1).strip()
         
         # Find dealer name - look for "Autohaus", "Peugeot", "Stellantis"
         dealer = None
-        dealer_match = re.search(r'((?:Autohaus|Peugeot|Stellantis)[^\n]*?)(?:\n|$)', card_text, re.I)
-        if dealer_match:
-            dealer = dealer_match.group(1).strip()
-        else:
-            # Try finding in specific elements
-            dealer_elem = card.find(string=re.compile(r'Autohaus|Peugeot|Stellantis', re.I))
-            if dealer_elem:
-                dealer_parent = dealer_elem.find_parent(['div', 'p', 'span', 'strong'])
-                if dealer_parent:
-                    dealer = dealer_parent.get_text(strip=True)
+        lowered_text = card_text.lower()
+        if 'autohaus' in lowered_text or 'peugeot' in lowered_text or 'stellantis' in lowered_text:
+            dealer_match = _DEALER_RE.search(card_text)
+            if dealer_match:
+                dealer = dealer_match.group(1).strip()
+            else:
+                # Try finding in specific elements
+                dealer_elem = _find_string(card, _DEALER_NAME_RE)
+                if dealer_elem:
+                    dealer_parent = _find_parent(dealer_elem, ['div', 'p', 'span', 'strong'])
+                    if dealer_parent:
+                        dealer = _node_text(dealer_parent, strip=True)
         
         # Find lease terms (e.g., "36 Mon. / 5.000 km" or "36 Monate / 5000 km")
         terms = None
         km_per_year = None
-        terms_match = re.search(r'(\d+\s*Mon\.?\s*/\s*(\d+[.,]?\d*)\s*k?m)', card_text, re.I)
+        terms_match = _TERMS_RE.search(card_text)
         if terms_match:
-            terms = terms_match.group(1).strip()
-            # Extract km value and convert to integer (handle formats like "5.000" or "5000")
-            km_str = terms_match.group(2).replace('.', '').replace(',', '')
-            try:
-                km_per_year = int(km_str)
-            except ValueError:
-                km_per_year = None
+            terms, km_per_year = parse_terms(terms_match.group(1))
         else:
-            terms_elem = card.find(string=re.compile(r'\d+\s*Mon\.?\s*/\s*\d+', re.I))
+            terms_elem = _find_string(card, _TERMS_LINE_RE)
             if terms_elem:
-                terms = terms_elem.strip()
-                # Try to extract km from the text
-                km_match = re.search(r'/\s*(\d+[.,]?\d*)\s*k?m', terms, re.I)
-                if km_match:
-                    km_str = km_match.group(1).replace('.', '').replace(',', '')
-                    try:
-                        km_per_year = int(km_str)
-                    except ValueError:
-                        km_per_year = None
+                terms, km_per_year = parse_terms(_node_text(terms_elem))
         
         # Find link to offer - look for "Jetzt leasen" or similar buttons
         link = None
-        link_elem = card.find('a', href=True)
+        link_elem = _select_one(card, 'a[href]')
         if link_elem:
-            href = link_elem['href']
+            href = _get_attrs(link_elem)['href']
             if href.startswith('http'):
                 link = href
             elif href.startswith('/'):
@@ -224,11 +522,9 @@ def extract_offer_details(card, base_url: str) -> Optional[Dict]:
                 link = base_url.rstrip('/') + '/' + href.lstrip('/')
         
         # Create unique ID from model + dealer + price + terms
-        # This helps identify the same offer even if slightly different
-        unique_parts = [str(model or ''), str(dealer or ''), f"{monthly_price:.2f}", str(terms or '')]
-        offer_id = '_'.join(unique_parts).replace(' ', '_').lower()
-        # Clean up the ID
-        offer_id = re.sub(r'[^\w_]', '', offer_id)
+        # Hashed to a signed 64-bit integer so it fits an SQLite INTEGER key
+        unique_key = f"{model or ''}|{dealer or ''}|{monthly_price:.2f}|{terms or ''}".lower().encode('utf-8')
+        offer_id = int.from_bytes(hashlib.blake2b(unique_key, digest_size=8).digest(), 'big', signed=True)
         
         return {
             'id': offer_id,
@@ -241,86 +537,157 @@ def extract_offer_details(card, base_url: str) -> Optional[Dict]:
             'price_text': price_text
         }
     except Exception as e:
-        logger.debug(f"Error extracting offer details: {e}")
+        logger.debug("Error extracting offer details: %s", e)
         return None
 
 
+def build_page_url(base_url: str, page: int) -> str:
+    """
+    Build URL with pagination (append &page=X if URL already has query parameters)
+    """
+    if page == 1:
+        return base_url
+    # Check if URL already has query parameters
+    separator = '&' if '?' in base_url else '?'
+    return f"{base_url}{separator}page={page}"
+
+
+def _wait_for_rate_limit():
+    """
+    Block until the next request slot is free (REQUESTS_PER_SECOND across all threads)
+    """
+    global _next_request_at
+    with _rate_limit_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + 1 / REQUESTS_PER_SECOND
+    if wait > 0:
+        time.sleep(wait)
+
+
+def fetch_page(url: str, stop: Optional[threading.Event] = None) -> requests.Response:
+    """
+    Fetch a single page, respecting the global rate limit
+    Raises CancelledError instead if stop is set while waiting for a request slot
+    """
+    headers = {}
+    # Ask the server to skip the body if the page hasn't changed since last time
+    cached = _cached_page(url)
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    
+    _wait_for_rate_limit()
+    if stop is not None and stop.is_set():
+        raise CancelledError(url)
+    response = SESSION.get(url, headers=headers, timeout=30)
+    response.raise_for_status()
+    return response
+
+
+def fetch_pages(base_url: str, max_pages: int):
+    """
+    Yield (page, url, future) for each result page in order, where the future
+    resolves to the page's (offers, last_page) from fetch_and_parse_page()
+    Page 1 is fetched on its own; after that the next PREFETCH_PAGES pages are
+    fetched and parsed concurrently while the current one is processed. Pages
+    still pending when the caller stops iterating are cancelled, and workers
+    still waiting for a request slot skip their request.
+    """
+    executor = ThreadPoolExecutor(max_workers=PREFETCH_PAGES)
+    stop = threading.Event()
+    pending = {}
+    try:
+        for page in range(1, max_pages + 1):
+            # Only prefetch once page 1 has shown there are results to page through
+            last_ahead = page + PREFETCH_PAGES - 1 if page > 1 else page
+            for ahead in range(page, min(last_ahead, max_pages) + 1):
+                if ahead not in pending:
+                    pending[ahead] = executor.submit(fetch_and_parse_page, build_page_url(base_url, ahead), base_url, stop)
+            yield page, build_page_url(base_url, page), pending.pop(page)
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_page(url: str, response: requests.Response, base_url: str) -> Tuple[List[Dict], bool]:
+    """
+    Extract offers from a fetched page and check whether it is the last page
+    Unchanged pages (HTTP 304) reuse the results cached from the previous check
+    """
+    cached = _cached_page(url)
+    if response.status_code == 304 and cached:
+        logger.info("Page not modified since last check, using cached offers")
+        return cached['offers'], cached['last_page']
+    
+    # Every offer has a monthly rate, so scan the raw bytes once before building
+    # the DOM - pages without one (e.g. past the last page) are never parsed
+    if _RAW_MONAT_RE.search(response.content):
+        tree = parse_html(response.content)
+        
+        # Extract offers from this page
+        page_offers = get_offers_from_page(tree, base_url)
+        last_page = bool(page_offers) and is_last_page(tree, response.content, page_offers)
+    else:
+        logger.info("No monthly rates in page, skipping parse")
+        page_offers, last_page = [], False
+    
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        _page_cache[url] = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'offers': page_offers,
+            'last_page': last_page,
+            # Offers are only complete up to this price, see _extract_offers()
+            'price_cutoff': _price_cutoff()
+        }
+    else:
+        _page_cache.pop(url, None)
+    return page_offers, last_page
+
+
+def fetch_and_parse_page(url: str, base_url: str, stop: Optional[threading.Event] = None) -> Tuple[List[Dict], bool]:
+    """
+    Fetch and parse a page in a prefetch worker, so parsing overlaps with the
+    other downloads; only the extracted offers are kept, not the page body or tree
+    """
+    response = fetch_page(url, stop)
+    return parse_page(url, response, base_url)
+
+
 def scrape_all_offers() -> List[Dict]:
     """
     Scrape all offers from the Peugeot store, handling pagination
     """
     all_offers = []
-    page = 1
     base_url = config.STORE_URL
+    max_pages = 100  # Safety limit to prevent infinite loops
+    load_page_cache()
     
-    while True:
+    for page, url, pending_page in fetch_pages(base_url, max_pages):
         try:
-            # Build URL with pagination (append &page=X if URL already has query parameters)
-            if page == 1:
-                url = base_url
-            else:
-                # Check if URL already has query parameters
-                separator = '&' if '?' in base_url else '?'
-                url = f"{base_url}{separator}page={page}"
-            
-            logger.info(f"Scraping page {page}: {url}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+            logger.info("Scraping page %d: %s", page, url)
             
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'lxml')
-            
-            # Extract offers from this page
-            page_offers = get_offers_from_page(soup, base_url)
+            page_offers, last_page = pending_page.result()
             
             if not page_offers:
-                logger.info(f"No offers found on page {page}, stopping pagination")
+                logger.info("No offers found on page %d, stopping pagination", page)
                 break
             
             all_offers.extend(page_offers)
-            logger.info(f"Found {len(page_offers)} offers on page {page}")
+            logger.info("Found %d offers on page %d", len(page_offers), page)
             
             # Check if there's a next page
-            # Look for pagination indicators
-            next_link = soup.find('a', string=re.compile(r'»|next|weiter|>', re.I))
-            if not next_link:
-                # Try finding by aria-label or title
-                next_link = soup.find('a', {'aria-label': re.compile(r'next|weiter', re.I)})
-            
-            if next_link:
-                # Check if it's disabled
-                if 'disabled' in next_link.get('class', []) or 'aria-disabled' in next_link.attrs:
-                    break
-            else:
-                # Check if we're on the last page by looking for page numbers
-                # If current page number equals max page number, stop
-                page_info = soup.find(string=re.compile(r'\d+\s*von\s*\d+', re.I))
-                if page_info:
-                    match = re.search(r'(\d+)\s*von\s*(\d+)', page_info)
-                    if match:
-                        current = int(match.group(1))
-                        total = int(match.group(2))
-                        if current >= total:
-                            break
-                
-                # If no next link and we got fewer offers than expected, might be last page
-                if len(page_offers) < 10:  # Assuming at least 10 offers per page normally
-                    logger.info("Few offers found, might be last page")
-                    break
-            
-            page += 1
-            
-            # Safety limit to prevent infinite loops
-            if page > 100:
-                logger.warning("Reached page limit (100), stopping")
+            if last_page:
                 break
             
-            # Be respectful with requests
-            time.sleep(2)
+            if page >= max_pages:
+                logger.warning(f"Reached page limit ({max_pages}), stopping")
+                break
             
         except requests.RequestException as e:
             logger.error(f"Error fetching page {page}: {e}")
@@ -329,6 +696,7 @@ def scrape_all_offers() -> List[Dict]:
             logger.error(f"Unexpected error on page {page}: {e}")
             break
     
+    save_page_cache()
     logger.info(f"Total offers scraped: {len(all_offers)}")
     return all_offers
 
@@ -338,87 +706,156 @@ def filter_offers_by_price(offers: List[Dict], log: bool = False) -> List[Dict]:
     Filter offers by price range and km allowance
     """
     filtered = []
+    # Bind config values to locals once instead of looking them up per offer
+    min_price = config.MIN_PRICE
+    max_price = config.MAX_PRICE
+    km_allowance = config.KM_ALLOWANCE
     for offer in offers:
         # Check price range
-        if not (config.MIN_PRICE <= offer['monthly_price'] <= config.MAX_PRICE):
+        if not (min_price <= offer['monthly_price'] <= max_price):
             continue
         
         # Check km allowance (if km_per_year is None, include it - might be missing from some offers)
         if offer.get('km_per_year') is not None:
-            if offer['km_per_year'] != config.KM_ALLOWANCE:
+            if offer['km_per_year'] != km_allowance:
                 continue
         
         filtered.append(offer)
     
     if log:
-        logger.info(f"Filtered {len(filtered)} offers in price range €{config.MIN_PRICE}-€{config.MAX_PRICE} with {config.KM_ALLOWANCE} km/year")
+        logger.info(f"Filtered {len(filtered)} offers in price range €{min_price}-€{max_price} with {km_allowance} km/year")
     return filtered
 
 
+def _connect_offers_db() -> sqlite3.Connection:
+    """
+    Open the seen offers database, creating the table if needed
+    """
+    conn = sqlite3.connect(config.OFFERS_FILE)
+    with conn:
+        conn.execute('CREATE TABLE IF NOT EXISTS seen_offers (id INTEGER PRIMARY KEY)')
+    return conn
+
+
 def load_seen_offers() -> set:
     """
-    Load previously seen offer IDs from file
+    Load previously seen offer IDs from the database
     """
     try:
-        with open(config.OFFERS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return set(data.get('seen_offers', []))
-    except FileNotFoundError:
-        return set()
+        with closing(_connect_offers_db()) as conn:
+            return {row[0] for row in conn.execute('SELECT id FROM seen_offers')}
     except Exception as e:
         logger.error(f"Error loading seen offers: {e}")
         return set()
 
 
-def save_seen_offers(seen_offers: set):
+def save_seen_offers(offer_ids):
     """
-    Save seen offer IDs to file
+    Add newly seen offer IDs to the database (only writes the given IDs)
     """
     try:
-        with open(config.OFFERS_FILE, 'w', encoding='utf-8') as f:
-            json.dump({'seen_offers': list(seen_offers)}, f, indent=2)
+        with closing(_connect_offers_db()) as conn, conn:
+            conn.executemany('INSERT OR IGNORE INTO seen_offers (id) VALUES (?)', [(offer_id,) for offer_id in offer_ids])
     except Exception as e:
         logger.error(f"Error saving seen offers: {e}")
 
 
-def send_discord_notification(offer: Dict):
+def load_page_cache():
     """
-    Send a Discord webhook notification for a new offer
+    Load cached page validators and results from file
     """
     try:
-        logger.info(f"Attempting to send Discord notification for: {offer['model']} - €{offer['monthly_price']:.2f}/month")
-        
-        # Format the message
-        km_info = ""
-        if offer.get('km_per_year'):
-            km_info = f"\n**Kilometer:** {offer['km_per_year']:,} km/year"
-        
-        embed = {
-            "title": f"🚗 New Leasing Offer: {offer['model']}",
-            "description": f"**Monthly Rate:** €{offer['monthly_price']:.2f}{km_info}\n"
-                          f"**Dealer:** {offer['dealer']}\n"
-                          f"**Terms:** {offer.get('terms', 'N/A')}",
-            "color": 0x00ff00,  # Green color
-            "url": offer.get('link', config.STORE_URL),
-            "footer": {
-                "text": f"Peugeot Leasing Monitor • {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            }
+        with open(config.PAGE_CACHE_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+        # Entries written in an older format are dropped (pages are fetched fresh)
+        if data.get('version') == PAGE_CACHE_VERSION:
+            _page_cache.update(data['pages'])
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"Error loading page cache: {e}")
+
+
+def save_page_cache():
+    """
+    Save cached page validators and results to file
+    """
+    try:
+        with open(config.PAGE_CACHE_FILE, 'wb') as f:
+            # Copy first - prefetch workers may still be adding pages
+            f.write(orjson.dumps({'version': PAGE_CACHE_VERSION, 'pages': dict(_page_cache)}))
+    except Exception as e:
+        logger.error(f"Error saving page cache: {e}")
+
+
+def build_embed(offer: Dict) -> Dict:
+    """
+    Build the Discord embed describing a single offer
+    """
+    # Format the message
+    km_info = ""
+    if offer.get('km_per_year'):
+        km_info = f"\n**Kilometer:** {offer['km_per_year']:,} km/year"
+    
+    return {
+        "title": f"🚗 New Leasing Offer: {offer['model']}",
+        "description": f"**Monthly Rate:** €{offer['monthly_price']:.2f}{km_info}\n"
+                      f"**Dealer:** {offer['dealer']}\n"
+                      f"**Terms:** {offer.get('terms', 'N/A')}",
+        "color": 0x00ff00,  # Green color
+        "url": offer.get('link', config.STORE_URL),
+        "footer": {
+            "text": f"Peugeot Leasing Monitor • {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         }
+    }
+
+
+def _post_webhook(payload: Dict) -> requests.Response:
+    """
+    POST a payload to the Discord webhook, waiting and retrying when rate limited
+    """
+    for _ in range(3):
+        response = SESSION.post(config.DISCORD_WEBHOOK_URL, json=payload, timeout=10)
+        if response.status_code != 429:
+            break
+        retry_after = float(response.headers.get('Retry-After', 1))
+        logger.warning(f"Discord rate limit hit, retrying in {retry_after:.1f}s")
+        time.sleep(retry_after)
+    response.raise_for_status()
+    return response
+
+
+def send_discord_notifications(offers: List[Dict]) -> bool:
+    """
+    Send Discord webhook notifications for new offers
+    Offers are batched into messages of up to DISCORD_MAX_EMBEDS embeds each
+    """
+    try:
+        logger.info("Attempting to send Discord notification for %d offer(s)", len(offers))
         
         # Add mention if Discord user ID is configured
         content = ""
         if config.DISCORD_USER_ID and config.DISCORD_USER_ID.strip():
             content = f"<@{config.DISCORD_USER_ID.strip()}>"
         
-        payload = {
-            "content": content,
-            "embeds": [embed]
-        }
+        logger.debug("Sending webhook to: %.50s...", config.DISCORD_WEBHOOK_URL)
+        reset_after = 0.0
+        for chunk in (offers[i:i + DISCORD_MAX_EMBEDS] for i in range(0, len(offers), DISCORD_MAX_EMBEDS)):
+            # Wait for the rate limit bucket to refill if the last message used it up
+            if reset_after:
+                time.sleep(reset_after)
+            
+            payload = {
+                "content": content,
+                "embeds": [build_embed(offer) for offer in chunk]
+            }
+            response = _post_webhook(payload)
+            
+            reset_after = 0.0
+            if response.headers.get('X-RateLimit-Remaining') == '0':
+                reset_after = float(response.headers.get('X-RateLimit-Reset-After', 1))
         
-        logger.debug(f"Sending webhook to: {config.DISCORD_WEBHOOK_URL[:50]}...")
-        response = requests.post(config.DISCORD_WEBHOOK_URL, json=payload, timeout=10)
-        response.raise_for_status()
-        logger.info(f"✅ Discord notification sent successfully for: {offer['model']} (€{offer['monthly_price']:.2f}/month)")
+        logger.info("✅ Discord notification sent successfully for %d offer(s)", len(offers))
         return True
         
     except requests.RequestException as e:
@@ -442,48 +879,40 @@ def check_for_new_offers():
     # Load previously seen offers
     seen_offers = load_seen_offers()
     logger.info(f"Previously seen offers: {len(seen_offers)}")
+    load_page_cache()
+    
+    # The old offers.json IDs can't be converted to the hashed ones, so the first
+    # check after upgrading records the current offers without notifying again
+    upgrading = not seen_offers and os.path.exists(config.LEGACY_OFFERS_FILE)
+    if upgrading:
+        logger.info(f"Found {config.LEGACY_OFFERS_FILE} from an older version, marking current offers as seen without notifying")
     
     total_offers = 0
     total_filtered = 0
     total_new = 0
     
     try:
-        page = 1
         base_url = config.STORE_URL
         
         # URL already contains all filters: 24 months / 15,000 km and 24 months / 20,000 km, max price 151€, radius 50km
         # No need to add additional filters
         
-        while True:
+        # Limit pages to prevent very long runs (adjust based on typical filtered results)
+        # If using price filter, should be much fewer pages
+        max_pages = 50  # Reasonable limit for filtered results
+        
+        for page, url, pending_page in fetch_pages(base_url, max_pages):
             try:
-                # Build URL with pagination (append &page=X if URL already has query parameters)
-                if page == 1:
-                    url = base_url
-                else:
-                    # Check if URL already has query parameters
-                    separator = '&' if '?' in base_url else '?'
-                    url = f"{base_url}{separator}page={page}"
-                
-                logger.info(f"Scraping page {page}: {url}")
-                
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-                
-                response = requests.get(url, headers=headers, timeout=30)
-                response.raise_for_status()
+                logger.info("Scraping page %d: %s", page, url)
                 
-                soup = BeautifulSoup(response.content, 'lxml')
-                
-                # Extract offers from this page
-                page_offers = get_offers_from_page(soup, base_url)
+                page_offers, last_page = pending_page.result()
                 
                 if not page_offers:
-                    logger.info(f"No offers found on page {page}, stopping pagination")
+                    logger.info("No offers found on page %d, stopping pagination", page)
                     break
                 
                 total_offers += len(page_offers)
-                logger.info(f"Found {len(page_offers)} offers on page {page} (Total so far: {total_offers})")
+                logger.info("Found %d offers on page %d (Total so far: %d)", len(page_offers), page, total_offers)
                 
                 # Filter by price range immediately
                 filtered_page_offers = filter_offers_by_price(page_offers)
@@ -491,76 +920,57 @@ def check_for_new_offers():
                 
                 # Early stopping: If all offers on this page are above max price, we've gone past filtered results
                 if page_offers:
-                    all_above_max = all(offer['monthly_price'] > config.MAX_PRICE for offer in page_offers)
+                    max_price = config.MAX_PRICE
+                    all_above_max = all(offer['monthly_price'] > max_price for offer in page_offers)
                     if all_above_max:
-                        logger.info(f"All offers on page {page} are above max price (€{config.MAX_PRICE}). Stopping early.")
+                        logger.info("All offers on page %d are above max price (€%s). Stopping early.", page, config.MAX_PRICE)
                         break
                     
                     # Also stop if we've gone many pages without finding any in-range offers
                     if page > 10 and total_filtered == 0:
-                        logger.info(f"Scraped {page} pages with no offers in range. Stopping early.")
+                        logger.info("Scraped %d pages with no offers in range. Stopping early.", page)
                         break
                 
                 if filtered_page_offers:
-                    logger.info(f"  → {len(filtered_page_offers)} offers in price range (€{config.MIN_PRICE}-€{config.MAX_PRICE}) with {config.KM_ALLOWANCE} km/year on this page")
+                    logger.info("  → %d offers in price range (€%s-€%s) with %s km/year on this page",
+                                len(filtered_page_offers), config.MIN_PRICE, config.MAX_PRICE, config.KM_ALLOWANCE)
                     
                     # Check for new offers and notify immediately
-                    new_page_offers = [offer for offer in filtered_page_offers if offer['id'] not in seen_offers]
+                    page_ids = {offer['id']: offer for offer in filtered_page_offers}
+                    new_ids = page_ids.keys() - seen_offers
                     
-                    if new_page_offers:
+                    if new_ids and upgrading:
+                        save_seen_offers(new_ids)
+                        logger.info("  → %d offers marked as seen (upgrade, no notifications)", len(new_ids))
+                    elif new_ids:
+                        # Keep the page order for the notifications
+                        new_page_offers = [offer for offer_id, offer in page_ids.items() if offer_id in new_ids]
                         total_new += len(new_page_offers)
-                        logger.info(f"  → {len(new_page_offers)} NEW offers found on page {page}! Sending notifications...")
+                        logger.info("  → %d NEW offers found on page %d! Sending notifications...", len(new_page_offers), page)
                         
                         for i, offer in enumerate(new_page_offers, 1):
                             km_info = f" ({offer.get('km_per_year', 'N/A')} km/year)" if offer.get('km_per_year') else ""
-                            logger.info(f"  📢 [{i}/{len(new_page_offers)}] {offer['model']} - €{offer['monthly_price']:.2f}/month{km_info}")
-                            send_discord_notification(offer)
-                            seen_offers.add(offer['id'])
-                            time.sleep(1)  # Small delay between notifications
+                            logger.info("  📢 [%d/%d] %s - €%.2f/month%s",
+                                        i, len(new_page_offers), offer['model'], offer['monthly_price'], km_info)
+                        send_discord_notifications(new_page_offers)
                         
                         # Save after each page to persist progress
-                        save_seen_offers(seen_offers)
-                        logger.info(f"  ✅ Notifications sent for page {page}!")
+                        save_seen_offers(new_ids)
+                        logger.info("  ✅ Notifications sent for page %d!", page)
                     else:
-                        logger.info(f"  → All {len(filtered_page_offers)} offers on this page were already seen")
+                        logger.info("  → All %d offers on this page were already seen", len(filtered_page_offers))
                     
                     # Mark all filtered offers as seen (even if not new, to track current state)
-                    for offer in filtered_page_offers:
-                        seen_offers.add(offer['id'])
+                    seen_offers.update(page_ids)
                 
                 # Check if there's a next page
-                next_link = soup.find('a', string=re.compile(r'»|next|weiter|>', re.I))
-                if not next_link:
-                    next_link = soup.find('a', {'aria-label': re.compile(r'next|weiter', re.I)})
-                
-                if next_link:
-                    if 'disabled' in next_link.get('class', []) or 'aria-disabled' in next_link.attrs:
-                        break
-                else:
-                    page_info = soup.find(string=re.compile(r'\d+\s*von\s*\d+', re.I))
-                    if page_info:
-                        match = re.search(r'(\d+)\s*von\s*(\d+)', page_info)
-                        if match:
-                            current = int(match.group(1))
-                            total = int(match.group(2))
-                            if current >= total:
-                                break
-                    
-                    if len(page_offers) < 10:
-                        logger.info("Few offers found, might be last page")
-                        break
-                
-                page += 1
+                if last_page:
+                    break
                 
-                # Limit pages to prevent very long runs (adjust based on typical filtered results)
-                # If using price filter, should be much fewer pages
-                max_pages = 50  # Reasonable limit for filtered results
-                if page > max_pages:
+                if page >= max_pages:
                     logger.warning(f"Reached page limit ({max_pages}), stopping. If you're getting many pages, consider using website's price filter.")
                     break
                 
-                time.sleep(2)
-                
             except requests.RequestException as e:
                 logger.error(f"Error fetching page {page}: {e}")
                 break
@@ -577,8 +987,12 @@ def check_for_new_offers():
         logger.info(f"Total offers tracked: {len(seen_offers)}")
         logger.info("=" * 60)
         
-        # Final save
-        save_seen_offers(seen_offers)
+        save_page_cache()
+        
+        # Upgrade done once the current offers are recorded - keep the old file as a backup
+        if upgrading and seen_offers:
+            os.replace(config.LEGACY_OFFERS_FILE, config.LEGACY_OFFERS_FILE + '.bak')
+            logger.info(f"Upgrade complete, moved {config.LEGACY_OFFERS_FILE} to {config.LEGACY_OFFERS_FILE}.bak")
         
     except Exception as e:
         logger.error(f"Error during offer check: {e}", exc_info=True)